@@ -0,0 +1,134 @@
+"""
+Redis Memory Benchmark
+
+Compare the memory used by the previous redis layout (one top-level key per job link with a timestamp
+value) against the bucketed layout in `RedisUtilities`.
+
+The benchmark FLUSHES the selected database, so point it at a scratch redis instance.
+
+Usage (from the repository root):
+- python -m benchmarks.redis_memory --links 1000000 --host localhost --db 15
+"""
+
+import argparse
+import math
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+import redis
+
+from src.RedisUtilities import RedisUtilities
+
+
+def getUsedMemory(redis_client: redis.client.Redis) -> int:
+    """
+    Retrieve the memory used by redis in bytes.
+
+    Parameters:
+        - redis_client: The redis client
+    Returns:
+        - int: The used memory in bytes
+    """
+    return redis_client.info("memory")["used_memory"]
+
+
+def getJobLink(index: int) -> str:
+    """
+    Create a job link similar to the ones in the SimplifyJobs repositories.
+
+    Parameters:
+        - index: The index of the job link
+    Returns:
+        - str: The job link
+    """
+    company = f"company{index % 5000}"
+    return f"https://boards.greenhouse.io/{company}/jobs/{4000000000 + index}?utm_source=Simplify&ref=Simplify"
+
+
+def getHashEncodings(redis_client: redis.client.Redis) -> tuple[Counter, int]:
+    """
+    Retrieve the encoding of every bucket and the size of the largest one.
+
+    Parameters:
+        - redis_client: The redis client
+    Returns:
+        - tuple[Counter, int]: The number of buckets per encoding and the most fields in a bucket
+    """
+    keys = list(redis_client.scan_iter(match=f"{RedisUtilities.KEY_PREFIX}:*", count=10_000))
+    pipeline = redis_client.pipeline(transaction=False)
+    for key in keys:
+        pipeline.object("encoding", key)
+        pipeline.hlen(key)
+    results = pipeline.execute()
+    encodings = Counter(
+        encoding.decode("utf-8") if isinstance(encoding, bytes) else encoding for encoding in results[::2]
+    )
+    return encodings, max(results[1::2], default=0)
+
+
+def loadLegacyLayout(redis_client: redis.client.Redis, total_links: int, batch_size: int) -> None:
+    pipeline = redis_client.pipeline(transaction=False)
+    timestamp = datetime.now().strftime(RedisUtilities.LEGACY_DATE_FORMAT)
+    for index in range(total_links):
+        pipeline.set(getJobLink(index), timestamp)
+        if (index + 1) % batch_size == 0:
+            pipeline.execute()
+    pipeline.execute()
+
+
+def loadBucketedLayout(redis_utilities: RedisUtilities, total_links: int, batch_size: int) -> None:
+    # Spread the job links evenly across the months of the retention window
+    months = redis_utilities.getLiveMonths(datetime.now())
+    for start in range(0, total_links, batch_size):
+        end = min(start + batch_size, total_links)
+        posted_at = months[(start // batch_size) % len(months)] + timedelta(hours=12)
+        redis_utilities.markPosted((getJobLink(index) for index in range(start, end)), posted_at)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the memory of the legacy and bucketed redis layouts.")
+    parser.add_argument("--links", type=int, default=1_000_000)
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--db", type=int, default=15)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--retention-days", type=int, default=180)
+    parser.add_argument("--links-per-month", type=int, help="Defaults to the links spread across the live months")
+    args = parser.parse_args()
+
+    redis_client = redis.Redis(host=args.host, port=args.port, db=args.db)
+    live_months = len(RedisUtilities(redis_client, args.retention_days).getLiveMonths(datetime.now()))
+    links_per_month = args.links_per_month or math.ceil(args.links / live_months)
+    redis_utilities = RedisUtilities(redis_client, args.retention_days, links_per_month)
+    version = redis_client.info("server")["redis_version"]
+    max_entries = redis_client.config_get("hash-max-*-entries")
+    print(f"Redis {version} {max_entries}, {redis_utilities.shards} shards x {live_months} months")
+    results = {}
+    try:
+        for layout, load in [
+            ("legacy", lambda: loadLegacyLayout(redis_client, args.links, args.batch_size)),
+            ("bucketed", lambda: loadBucketedLayout(redis_utilities, args.links, args.batch_size)),
+        ]:
+            redis_client.flushdb()
+            baseline = getUsedMemory(redis_client)
+            start_time = time.perf_counter()
+            load()
+            elapsed = time.perf_counter() - start_time
+            used_memory = getUsedMemory(redis_client) - baseline
+            results[layout] = used_memory
+            print(
+                f"{layout:>8}: {used_memory / 1024 ** 2:8.1f} MiB, {used_memory / args.links:6.1f} bytes/link, "
+                f"{redis_client.dbsize():>9,} keys, loaded in {elapsed:.1f}s"
+            )
+        encodings, max_fields = getHashEncodings(redis_client)
+        print(f"Bucket encodings: {dict(encodings)}, largest bucket has {max_fields} fields")
+        redis_client.flushdb()
+    finally:
+        redis_client.close()
+
+    print(f"The bucketed layout uses {results['bucketed'] / results['legacy']:.1%} of the legacy memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ Discord Bot
 
 This bot is responsible for sending internship and co-op opportunities to a Discord channel. 
 It uses the GitHub API to track changes in the repository and sends the new opportunities to the Discord channel.
+New commits are found by polling, or right away from GitHub push webhooks when `GITHUB_WEBHOOK_SECRET` is set.
 
 Prerequisites:
 - PyGithub: A Python library to access the GitHub API v3.
@@ -15,6 +16,7 @@ import asyncio
 import logging
 import os
 from datetime import datetime
+from typing import Optional
 from logging.handlers import RotatingFileHandler
 
 import discord
@@ -22,13 +24,21 @@ import redis
 from DatabaseConnector import DatabaseConnector
 from discord.ext import commands, tasks
 from dotenv import load_dotenv
+from github import GithubException
 
 from GitHubUtilities import GitHubUtilities
 from JobsUtilities import JobsUtilities
+from RedisUtilities import RedisUtilities
+from TaskSupervisor import DependencyError, TaskSupervisor
+from WebhookReceiver import WebhookReceiver
 
 load_dotenv()
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
 GITHUB_TOKEN = os.getenv("GIT_TOKEN")
+WEBHOOK_SECRET = os.getenv("GITHUB_WEBHOOK_SECRET")
+WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", "8080"))
+WEBHOOK_POLL_MINUTES = float(os.getenv("WEBHOOK_POLL_MINUTES", "10"))
+NEWGRAD_REPO = "SimplifyJobs/New-Grad-Positions"
 
 # Global Lock
 lock = asyncio.Lock()
@@ -51,104 +61,178 @@ logger.addHandler(handler)
 intents = discord.Intents.default()
 intents.messages = True
 intents.message_content = True
-bot = commands.Bot(command_prefix="$", intents=intents)
 
 
-@tasks.loop(hours=12)
-async def health_check_task():
-    """
-    A scheduled task that runs every 12 hours to check the database connection and prevent shutdown
-    """
+class ColorStackBot(commands.Bot):
+    async def close(self):
+        """
+        Stop receiving webhooks before closing the connection to Discord.
+        """
+        if webhook_receiver is not None:
+            await webhook_receiver.stop()
+        await super().close()
 
-    async with lock:
-        try:
-            logger.info("Conducting a health check...")
-            db = DatabaseConnector()
-            _ = db.getChannels()
-            logger.info("Able to connect to database!")
-        except Exception:
-            logger.error("An error occurred in the health check task.", exc_info=True)
 
+bot = ColorStackBot(command_prefix="$", intents=intents)
 
-@tasks.loop(seconds=60)
-async def scheduled_task(job_utilities: JobsUtilities):
-    """
-    A scheduled task that runs every 60 seconds to check for new commits in the GitHub repository.
-
-    Parameters:
-        - job_utilities: The JobsUtilities object
-    """
-    async with lock:
-        try:
-            start_time = datetime.now()
 
-            latest_repo = JobsUtilities.get_latest_internship_repo()
-            logger.info(f"Using latest internship repository: {latest_repo}")
+# Supervise the dependencies so an outage skips work instead of shutting down the bot
+supervisor = TaskSupervisor(
+    ["github", "redis", "database", "discord"],
+    errors={
+        redis.exceptions.RedisError: "redis",
+        GithubException: "github",
+        discord.DiscordException: "discord",
+    },
+)
 
-            internship_github = GitHubUtilities(
-                token=GITHUB_TOKEN, repo_name=f"SimplifyJobs/{latest_repo}", isSummer=True, isCoop=True
-            )
-            newgrad_github = GitHubUtilities(token=GITHUB_TOKEN, repo_name="SimplifyJobs/New-Grad-Positions")
+# Last channels read from the database, used while the database is unavailable
+cached_channel_ids = []
 
-            internship_repo = internship_github.createGitHubConnection()
-            internship_sha = internship_github.getSavedSha(internship_repo, False)
-            newgrad_repo = newgrad_github.createGitHubConnection()
-            newgrad_sha = newgrad_github.getSavedSha(newgrad_repo, True)
-            redis_client = redis.Redis(host="redis", port=6379, db=0)
+# Receives GitHub push webhooks when GITHUB_WEBHOOK_SECRET is set
+webhook_receiver = None
 
-            # Process all internship
-            if internship_github.isNewCommit(internship_repo, internship_sha):
-                logger.info("New internship commit has been found. Finding new jobs...")
-                internship_github.setComparison(internship_repo, False)
 
-                # Get the channels to send the job postings
-                db = DatabaseConnector()
-                channel_ids = db.getChannels()
+def getChannels() -> list[int]:
+    """
+    Retrieve the channels to send the job postings, falling back to the cached channels.
 
-                if internship_github.is_coop:
-                    job_postings = internship_github.getCommitChanges("README-Off-Season.md")
-                    await job_utilities.getJobs(bot, redis_client, channel_ids[:20], job_postings, "Co-Op")
+    Returns:
+        - list[int]: The channel ids
+    """
+    global cached_channel_ids
+    try:
+        cached_channel_ids = supervisor.call("database", lambda: DatabaseConnector().getChannels())
+    except DependencyError:
+        if not cached_channel_ids:
+            raise
+        logger.warning("The database is unavailable, using the cached channels.", exc_info=True)
+    return cached_channel_ids
 
-                if internship_github.is_summer:
-                    job_postings = internship_github.getCommitChanges("README.md")
-                    await job_utilities.getJobs(bot, redis_client, channel_ids[:20], job_postings, "Summer")
 
-                sha_commit = internship_github.getLastCommit(internship_repo)
-                internship_github.setNewCommit(sha_commit, False)
-                logger.info(f"There were {job_utilities.total_jobs} new jobs found!")
+def checkDiscordConnection() -> None:
+    """
+    Verify that the bot is connected to the Discord gateway before posting.
+    """
+    if bot.is_closed() or not bot.is_ready():
+        raise ConnectionError("The bot is not connected to Discord")
 
-                # Clear all the cached data
-                job_utilities.clearJobLinks()
-                job_utilities.clearJobCounter()
-                internship_github.clearComparison()
 
-                logger.info("All internship jobs have been posted!")
+async def processRepository(
+    github_utilities: GitHubUtilities,
+    job_utilities: JobsUtilities,
+    redis_utilities: RedisUtilities,
+    readme_terms: dict[str, str],
+    isNewGrad: bool,
+) -> None:
+    """
+    Post the new jobs of a repository and save its latest commit once they have all been posted.
 
-            # Process all new grad jobs
-            if newgrad_github.isNewCommit(newgrad_repo, newgrad_sha):
-                logger.info("New grad commit has been found. Finding new jobs...")
-                newgrad_github.setComparison(newgrad_repo, True)
+    Parameters:
+        - github_utilities: The GitHubUtilities object for the repository
+        - job_utilities: The JobsUtilities object
+        - redis_utilities: The store of job links that have been posted
+        - readme_terms: The .md files to read mapped to the term of their job postings
+        - isNewGrad: True if the repository is for new grad
+    """
+    repo = supervisor.call("github", github_utilities.createGitHubConnection)
+    # Read from the local commits file, so a file error isn't reported as a GitHub outage
+    saved_sha = github_utilities.getSavedSha(repo, isNewGrad)
+    if not supervisor.call("github", github_utilities.isNewCommit, repo, saved_sha):
+        return
 
-                # Get the channels to send the job postings
-                db = DatabaseConnector()
-                channel_ids = db.getChannels()
-                job_postings = newgrad_github.getCommitChanges("README.md")
-                await job_utilities.getJobs(bot, redis_client, channel_ids[:20], job_postings, "New Grad")
+    logger.info(f"New commit has been found in {github_utilities.repo_name}. Finding new jobs...")
+    try:
+        # Read the head once, so the saved commit is the one the comparison ended at
+        sha_commit = supervisor.call("github", github_utilities.getLastCommit, repo)
+        supervisor.call("github", github_utilities.setComparison, repo, isNewGrad, saved_sha, sha_commit)
+
+        # Make sure the jobs can be tracked and posted before going through the changes
+        channel_ids = getChannels()
+        supervisor.call("redis", redis_utilities.redis_client.ping)
+        supervisor.call("discord", checkDiscordConnection)
+
+        for readme_file, term in readme_terms.items():
+            job_postings = github_utilities.getCommitChanges(readme_file)
+            # Send errors such as OSError or timeouts aren't wrapped by discord.py, so blame Discord by default
+            await supervisor.callAsync(
+                "discord", job_utilities.getJobs, bot, redis_utilities, channel_ids[:20], job_postings, term
+            )
 
-                sha_commit = newgrad_github.getLastCommit(newgrad_repo)
-                newgrad_github.setNewCommit(sha_commit, True)
-                logger.info(f"There were {job_utilities.total_jobs} new jobs found!")
+        github_utilities.setNewCommit(sha_commit, isNewGrad)
+        logger.info(f"There were {job_utilities.total_jobs} new jobs found!")
+        logger.info(f"All jobs from {github_utilities.repo_name} have been posted!")
+    finally:
+        # Clear all the cached data
+        job_utilities.clearJobLinks()
+        job_utilities.clearJobCounter()
+        github_utilities.clearComparison()
 
-                # Clear all the cached data
-                job_utilities.clearJobLinks()
-                job_utilities.clearJobCounter()
-                newgrad_github.clearComparison()
 
-                logger.info("All new grad jobs have been posted!")
+@tasks.loop(hours=12)
+async def health_check_task():
+    """
+    A scheduled task that runs every 12 hours to check the database connection and report the circuit breakers
+    """
 
+    async with lock:
+        try:
+            logger.info("Conducting a health check...")
+            _ = supervisor.call("database", lambda: DatabaseConnector().getChannels())
+            logger.info("Able to connect to database!")
         except Exception:
-            logger.error("An error occurred in the scheduled task.", exc_info=True)
-            await bot.close()
+            logger.error("An error occurred in the health check task.", exc_info=True)
+        finally:
+            logger.info(f"Circuit breakers: {supervisor.getReport()}")
+
+
+async def processRepositories(job_utilities: JobsUtilities, repo_name: Optional[str] = None):
+    """
+    Post the new jobs of every repository, or only of the repository that was pushed to.
+    A failing dependency only skips the repositories that need it, and the commits are retried on the next run.
+
+    Parameters:
+        - job_utilities: The JobsUtilities object
+        - repo_name: The full name of the repository to process, all of them if not given
+    """
+    async with lock:
+        start_time = datetime.now()
+        redis_client = redis.Redis(host="redis", port=6379, db=0)
+        redis_utilities = RedisUtilities(redis_client)
+        try:
+            repositories = []
+            if repo_name != NEWGRAD_REPO:
+                try:
+                    latest_repo = supervisor.call("github", JobsUtilities.get_latest_internship_repo)
+                    logger.info(f"Using latest internship repository: {latest_repo}")
+                    internship_github = GitHubUtilities(
+                        token=GITHUB_TOKEN, repo_name=f"SimplifyJobs/{latest_repo}", isSummer=True, isCoop=True
+                    )
+                    internship_readmes = {}
+                    if internship_github.is_coop:
+                        internship_readmes["README-Off-Season.md"] = "Co-Op"
+                    if internship_github.is_summer:
+                        internship_readmes["README.md"] = "Summer"
+                    repositories.append((internship_github, internship_readmes, False))
+                except DependencyError as e:
+                    logger.warning(f"Skipping the internship jobs: {e}")
+
+            newgrad_github = GitHubUtilities(token=GITHUB_TOKEN, repo_name=NEWGRAD_REPO)
+            repositories.append((newgrad_github, {"README.md": "New Grad"}, True))
+
+            if repo_name is not None:
+                repositories = [repository for repository in repositories if repository[0].repo_name == repo_name]
+                if not repositories:
+                    logger.info(f"Ignoring push to {repo_name} since it isn't a tracked repository")
+
+            # Process every repository on its own so one failure doesn't block the others
+            for github_utilities, readme_terms, isNewGrad in repositories:
+                try:
+                    await processRepository(github_utilities, job_utilities, redis_utilities, readme_terms, isNewGrad)
+                except DependencyError as e:
+                    logger.warning(f"Skipping {github_utilities.repo_name} until the next run: {e}")
+                except Exception:
+                    logger.error(f"An error occurred processing {github_utilities.repo_name}.", exc_info=True)
         finally:
             redis_client.close()
             end_time = datetime.now()
@@ -156,6 +240,18 @@ async def scheduled_task(job_utilities: JobsUtilities):
             logger.info(f"Task execution time: {execution_time}")
 
 
+@tasks.loop(seconds=60)
+async def scheduled_task(job_utilities: JobsUtilities):
+    """
+    A scheduled task that runs every 60 seconds to check for new commits in the GitHub repositories.
+    When the webhook receiver is enabled, it runs every `WEBHOOK_POLL_MINUTES` to catch any missed pushes.
+
+    Parameters:
+        - job_utilities: The JobsUtilities object
+    """
+    await processRepositories(job_utilities)
+
+
 @bot.event
 async def on_guild_remove(guild: discord.Guild):
     """
@@ -203,19 +299,49 @@ async def before_scheduled_task():
     await bot.wait_until_ready()
 
 
+async def startWebhookReceiver(job_utilities: JobsUtilities):
+    """
+    Start receiving GitHub push webhooks and slow down polling to a fallback that catches missed pushes.
+
+    Parameters:
+        - job_utilities: The JobsUtilities object
+    """
+    global webhook_receiver
+    if webhook_receiver is not None:
+        return  # on_ready is triggered again after reconnecting
+
+    receiver = WebhookReceiver(WEBHOOK_SECRET, lambda repo_name: processRepositories(job_utilities, repo_name))
+    try:
+        await receiver.start(port=WEBHOOK_PORT)
+    except Exception:
+        # Keep polling every 60 seconds and try again on the next on_ready
+        logger.error("Failed to start the webhook receiver, polling for new commits instead.", exc_info=True)
+        await receiver.stop()
+        return
+
+    webhook_receiver = receiver
+    scheduled_task.change_interval(minutes=WEBHOOK_POLL_MINUTES)
+
+
 @bot.event
 async def on_ready():
     """
     Event that is triggered when the bot is ready to start sending messages.
     """
     logger.info(f"Logged in as {bot.user.name}")
+    job_utilities = JobsUtilities()
     try:
-        job_utilities = JobsUtilities()
-        scheduled_task.start(job_utilities)  # Start the loop
-        health_check_task.start()  # Start health check task
+        # on_ready is triggered again after reconnecting, so only start the loops once
+        if not scheduled_task.is_running():
+            scheduled_task.start(job_utilities)  # Start the loop
+        if not health_check_task.is_running():
+            health_check_task.start()  # Start health check task
     except Exception as e:
         logger.error(f"Failed to start scheduled tasks: {e}", exc_info=True)
 
+    if WEBHOOK_SECRET:
+        await startWebhookReceiver(job_utilities)
+
 
 if __name__ == "__main__":
     try:
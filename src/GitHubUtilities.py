@@ -12,6 +12,7 @@ Prerequisites:
 import json
 from collections.abc import Iterable
 from pathlib import Path
+from typing import Optional
 
 import github
 from github import Auth, Github
@@ -87,19 +88,29 @@ class GitHubUtilities:
         else:
             return commit_sha
 
-    def setComparison(self, repo: github.Repository.Repository, isNewGrad: bool) -> None:
+    def setComparison(
+        self,
+        repo: github.Repository.Repository,
+        isNewGrad: bool,
+        previous_commit: Optional[str] = None,
+        recent_commit: Optional[str] = None,
+    ) -> None:
         """
         Set the comparison between the previous commit and the recent commit
 
         Parameters:
             - repo: The GitHub repository
             - isNewGrad: True if repo is for new grad 
+            - previous_commit: The base commit sha, defaults to the saved commit
+            - recent_commit: The head commit sha, defaults to the last commit of the branch
         """
-        recent_commit = self.getLastCommit(repo)
+        if recent_commit is None:
+            recent_commit = self.getLastCommit(repo)
         if not recent_commit:
             self.comparison = None
 
-        previous_commit = self.getSavedSha(repo, isNewGrad)  # Get the saved commit
+        if previous_commit is None:
+            previous_commit = self.getSavedSha(repo, isNewGrad)  # Get the saved commit
         comparison = repo.compare(base=previous_commit, head=recent_commit)
         self.comparison = comparison
 
@@ -144,3 +155,20 @@ class GitHubUtilities:
                         and "🔒" not in line
                     ):
                         yield line
+
+    def getFileSnapshot(self, repo: github.Repository.Repository, readme_file: str, sha: str) -> Iterable[str]:
+        """
+        Retrieve every job posting line of the .md file at a given commit
+
+        Parameters:
+            - repo: The GitHub repository
+            - readme_file: The name of the .md file
+            - sha: The commit sha to read the file at
+        Returns:
+            - Iterable[str]: The lines that contain the job postings, formatted like `getCommitChanges`
+        """
+        contents = repo.get_contents(readme_file, ref=sha)
+        for line in contents.decoded_content.decode("utf-8").split("\n"):
+            # Prefix with "+" so the rows are parsed the same way as commit additions
+            if line.startswith("|") and "🔒" not in line:
+                yield f"+{line}"
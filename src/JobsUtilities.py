@@ -15,18 +15,24 @@ import os
 import re
 from collections.abc import Iterable
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
 import discord
 import redis
 from dotenv import load_dotenv
 from github import Github, GithubException
 
+if TYPE_CHECKING:
+    from RedisUtilities import RedisUtilities
+
 load_dotenv()
 
 GITHUB_TOKEN = os.getenv("GIT_TOKEN")
 
 class JobsUtilities:
     NOT_US = ["canada", "uk", "united kingdom", "eu"]
+    # Send errors that only affect the channel of a single server, not Discord itself
+    CHANNEL_ERRORS = (discord.Forbidden, discord.NotFound)
     latest_cached_repo = None
 
     def __init__(self):
@@ -67,10 +73,63 @@ class JobsUtilities:
         """
         self.previous_job_title = company_name
 
+    def getJobLink(self, non_empty_elements: list[str], term: str) -> str:
+        """
+        Retrieve the application link from a parsed job posting.
+
+        Parameters:
+            - non_empty_elements: The stripped table cells of the job posting.
+            - term: Timeline of the job posting
+        Returns:
+            - str: The job link
+        """
+        # Co-Op postings have an extra "Terms" column before the application link
+        job_link_index = 5 if term == "Co-Op" else 4
+        return re.search(r'href="([^"]+)"', non_empty_elements[job_link_index]).group(1)
+
+    def getJobLinks(self, job_postings: Iterable[str], term: str) -> Iterable[str]:
+        """
+        Retrieve the unique job links from the job postings without filtering or posting them.
+
+        Parameters:
+            - job_postings: The list of job postings.
+            - term: Timeline of the job posting
+        Returns:
+            - Iterable[str]: The job links in the order they were found
+        """
+        if term not in ["Summer", "Co-Op", "New Grad"]:
+            raise ValueError("Term must be one of these: Summer, Coop, NewGrad")
+
+        seen_links = set()
+        for job in job_postings:
+            non_empty_elements = [element.strip() for element in job.split("|") if element.strip()]
+            try:
+                job_link = self.getJobLink(non_empty_elements, term)
+            except (IndexError, AttributeError):
+                # Table separators and rows without an application link
+                continue
+
+            if job_link not in seen_links:
+                seen_links.add(job_link)
+                yield job_link
+
+    def seedJobLinks(self, redis_utilities: "RedisUtilities", job_links: Iterable[str], batch_size: int = 1000) -> int:
+        """
+        Mark the job links as posted in redis without sending them to Discord.
+
+        Parameters:
+            - redis_utilities: The store of job links that have been posted
+            - job_links: The job links to save
+            - batch_size: The number of job links sent per pipeline round trip
+        Returns:
+            - int: The number of job links that were not already in redis
+        """
+        return redis_utilities.addJobLinks(job_links, batch_size)
+
     async def getJobs(
         self,
         bot: discord.ext.commands.Bot,
-        redis_client: redis.client.Redis,
+        redis_utilities: "RedisUtilities",
         channels: list[int],
         job_postings: Iterable[str],
         term: str,
@@ -80,6 +139,7 @@ class JobsUtilities:
 
         Parameters:
             - bot: The Discord bot.
+            - redis_utilities: The store of job links that have been posted.
             - channels: All the channels to send the job postings to
             - job_postings: The list of job postings.
             - term: Timeline of the job posting
@@ -91,20 +151,17 @@ class JobsUtilities:
         has_printed = False
         for job in job_postings:
             try:
-                # Determine the index of the job link
-                job_link_index = 5 if term == "Co-Op" else 4
-
                 # Grab the data and remove the empty elements
                 non_empty_elements = [element.strip() for element in job.split("|") if element.strip()]
 
                 # If the job link is already in the cache, we skip the job posting
-                job_link = re.search(r'href="([^"]+)"', non_empty_elements[job_link_index]).group(1)
+                job_link = self.getJobLink(non_empty_elements, term)
                 if job_link in self.job_cache:
                     continue
 
                 # Verify it hasn't been posted
-                if redis_client.exists(job_link):
-                    logging.info("It already exits within redis database: ", job_link)
+                if redis_utilities.isPosted(job_link):
+                    logging.info("It already exists within redis database: %s", job_link)
                     continue
 
                 self.job_cache.add(job_link)  # Save the job link
@@ -190,19 +247,51 @@ class JobsUtilities:
                 if term != "New Grad":
                     post += f"**➡️  When?:**  {terms}\n"
                 post += f"**👉 Job Link:** <{job_link}>\n" f"{'-' * 153}"
-                self.total_jobs += 1
-
-                # Add the job link to redis database
-                redis_client.set(job_link, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-                logging.info("Added the job link to redis!")
-
-                # Send the job posting to the Discord channel
-                coroutines = (bot.get_channel(channel).send(post) for channel in channels if bot.get_channel(channel))
-                await asyncio.gather(*coroutines)
+            except redis.exceptions.RedisError:
+                # Stop so the commit is retried instead of losing the jobs while redis is down
+                raise
             except Exception as e:
                 logging.exception("Failed to process job posting: %s\nJob: %s", e, job)
                 continue
 
+            # Send errors reach the caller so the commit is retried instead of losing the jobs
+            await self.sendJobPosting(bot, channels, post)
+
+            # Add the job link to redis database once it has been posted
+            redis_utilities.markPosted([job_link])
+            logging.info("Added the job link to redis!")
+            self.total_jobs += 1
+
+    async def sendJobPosting(self, bot: discord.ext.commands.Bot, channels: list[int], post: str) -> None:
+        """
+        Send the job posting to every channel.
+
+        The first error is raised only when no channel received the job posting, so it is retried without
+        posting it twice. Failures in some of the channels, or in channels that are missing or that the bot
+        lost its permissions for, are logged instead.
+
+        Parameters:
+            - bot: The Discord bot.
+            - channels: All the channels to send the job posting to
+            - post: The job posting message
+        """
+        available_channels = [(channel, bot.get_channel(channel)) for channel in channels if bot.get_channel(channel)]
+        results = await asyncio.gather(
+            *(discord_channel.send(post) for _, discord_channel in available_channels), return_exceptions=True
+        )
+        failures = [
+            (channel, result)
+            for (channel, _), result in zip(available_channels, results)
+            if isinstance(result, BaseException)
+        ]
+        if failures and len(failures) == len(available_channels):
+            for _, error in failures:
+                if not isinstance(error, self.CHANNEL_ERRORS):
+                    raise error
+
+        for channel, error in failures:
+            logging.warning("Failed to send the job posting to channel %s: %s", channel, error)
+
     @staticmethod
     def get_cached_latest_repo():
         return JobsUtilities.latest_cached_repo
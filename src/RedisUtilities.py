@@ -0,0 +1,240 @@
+"""
+Redis Utilities Class
+
+This class stores the job links that have been posted in redis to prevent duplicate job postings.
+Instead of saving every job link as its own top-level key, each link is hashed into a 64-bit id and
+stored as a field of a small hash bucketed by the month it was posted and sharded by the id:
+
+    jobs:{YYYYMM}:{shard} -> {link id: posted timestamp}
+
+Small hashes are kept in redis' compact listpack/ziplist encoding, and every bucket expires on its
+own once the retention window has passed, so the keyspace is trimmed one month at a time.
+
+The compact encoding requires every hash to stay within `hash-max-listpack-entries`
+(`hash-max-ziplist-entries` before Redis 7), which is 128 by default. The shards are sized from the
+expected job links per month so each hash holds about 64 fields, leaving room for uneven hashing and
+for twice the expected links. The shard count decides where links are saved, so `links_per_month`
+must not change while there are saved links.
+
+Prerequisites:
+- Redis: A Python library to interact with the redis database.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import Optional
+
+import redis
+
+
+class RedisUtilities:
+    KEY_PREFIX = "jobs"
+    LEGACY_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+    FIELDS_PER_SHARD = 64
+
+    def __init__(self, redis_client: redis.client.Redis, retention_days: int = 180, links_per_month: int = 20000):
+        self.redis_client = redis_client
+        self.retention = timedelta(days=retention_days)
+        self.shards = self.getShardCount(links_per_month)
+
+    def getShardCount(self, links_per_month: int) -> int:
+        """
+        Retrieve the number of hashes each monthly bucket is split into.
+
+        Parameters:
+            - links_per_month: The expected number of job links posted in a month
+        Returns:
+            - int: The smallest power of two that keeps about `FIELDS_PER_SHARD` fields in each hash
+        """
+        shards = 1
+        while shards * self.FIELDS_PER_SHARD < links_per_month:
+            shards *= 2
+        return shards
+
+    def getLinkId(self, job_link: str) -> tuple[int, bytes]:
+        """
+        Hash the job link into its shard and 64-bit id.
+
+        Parameters:
+            - job_link: The job link
+        Returns:
+            - tuple[int, bytes]: The shard number and the 8 byte link id
+        """
+        link_id = hashlib.blake2b(job_link.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(link_id[:4], "big") % self.shards, link_id
+
+    def getBucketKey(self, month: datetime, shard: int) -> str:
+        """
+        Retrieve the redis key of a bucket.
+
+        Parameters:
+            - month: Any date within the month of the bucket
+            - shard: The shard number
+        Returns:
+            - str: The redis key
+        """
+        return f"{self.KEY_PREFIX}:{month:%Y%m}:{shard}"
+
+    def getBucketExpiry(self, month: datetime) -> datetime:
+        """
+        Retrieve when a bucket can be dropped, which is the end of its month plus the retention window.
+
+        Parameters:
+            - month: Any date within the month of the bucket
+        Returns:
+            - datetime: The expiry date of the bucket
+        """
+        start_of_month = month.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        next_month = (start_of_month + timedelta(days=32)).replace(day=1)
+        return next_month + self.retention
+
+    def getLiveMonths(self, current_date: datetime) -> list[datetime]:
+        """
+        Retrieve the months whose buckets are within the retention window, newest first.
+
+        Parameters:
+            - current_date: The current date
+        Returns:
+            - list[datetime]: The first day of each month
+        """
+        oldest = (current_date - self.retention).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        month = current_date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        months = []
+        while month >= oldest:
+            months.append(month)
+            month = (month - timedelta(days=1)).replace(day=1)
+        return months
+
+    def isPosted(self, job_link: str, current_date: Optional[datetime] = None) -> bool:
+        """
+        Determine if the job link has already been posted within the retention window.
+
+        Parameters:
+            - job_link: The job link
+            - current_date: The current date
+        Returns:
+            - bool: True if the job link has been posted, False otherwise
+        """
+        return job_link in self.getPostedLinks([job_link], current_date)
+
+    def getPostedLinks(self, job_links: list[str], current_date: Optional[datetime] = None) -> set[str]:
+        """
+        Retrieve which of the job links have already been posted in a single round trip.
+
+        Parameters:
+            - job_links: The job links
+            - current_date: The current date
+        Returns:
+            - set[str]: The job links that have been posted
+        """
+        months = self.getLiveMonths(current_date or datetime.now())
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for job_link in job_links:
+            shard, link_id = self.getLinkId(job_link)
+            for month in months:
+                pipeline.hexists(self.getBucketKey(month, shard), link_id)
+
+        results = pipeline.execute()
+        posted_links = set()
+        for index, job_link in enumerate(job_links):
+            if any(results[index * len(months) : (index + 1) * len(months)]):
+                posted_links.add(job_link)
+        return posted_links
+
+    def markPosted(self, job_links: Iterable[str], posted_at: Optional[datetime] = None) -> None:
+        """
+        Save the job links as posted.
+
+        Parameters:
+            - job_links: The job links
+            - posted_at: When the job links were posted
+        """
+        posted_at = posted_at or datetime.now()
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for job_link in job_links:
+            self._queuePosted(pipeline, job_link, posted_at)
+        pipeline.execute()
+
+    def _queuePosted(self, pipeline: redis.client.Pipeline, job_link: str, posted_at: datetime) -> None:
+        shard, link_id = self.getLinkId(job_link)
+        key = self.getBucketKey(posted_at, shard)
+        pipeline.hset(key, link_id, int(posted_at.timestamp()))
+        pipeline.expireat(key, self.getBucketExpiry(posted_at))
+
+    def addJobLinks(
+        self, job_links: Iterable[str], batch_size: int = 1000, posted_at: Optional[datetime] = None
+    ) -> int:
+        """
+        Save the job links that haven't been posted yet, batching the commands with pipelining.
+
+        Parameters:
+            - job_links: The job links
+            - batch_size: The number of job links sent per pipeline round trip
+            - posted_at: When the job links were posted
+        Returns:
+            - int: The number of job links that were not already saved
+        """
+        total_added = 0
+        batch = []
+        for job_link in job_links:
+            batch.append(job_link)
+            if len(batch) >= batch_size:
+                total_added += self._addBatch(batch, posted_at)
+                batch = []
+
+        if batch:
+            total_added += self._addBatch(batch, posted_at)
+        return total_added
+
+    def _addBatch(self, job_links: list[str], posted_at: Optional[datetime]) -> int:
+        posted_links = self.getPostedLinks(job_links, posted_at)
+        new_links = [job_link for job_link in job_links if job_link not in posted_links]
+        if new_links:
+            self.markPosted(new_links, posted_at)
+        return len(new_links)
+
+    def migrateLegacyKeys(self, batch_size: int = 1000, current_date: Optional[datetime] = None) -> int:
+        """
+        Move the job links saved as top-level keys with a timestamp value into the buckets.
+
+        Links older than the retention window are dropped instead of migrated. Keys that aren't in the
+        legacy format are left untouched, so the migration is safe to run more than once.
+
+        Parameters:
+            - batch_size: The number of keys read per round trip
+            - current_date: The current date
+        Returns:
+            - int: The number of job links migrated
+        """
+        current_date = current_date or datetime.now()
+        total_migrated = 0
+        batch = []
+        for key in self.redis_client.scan_iter(count=batch_size, _type="string"):
+            if not key.startswith(f"{self.KEY_PREFIX}:".encode("utf-8")):
+                batch.append(key)
+            if len(batch) >= batch_size:
+                total_migrated += self._migrateBatch(batch, current_date)
+                batch = []
+
+        if batch:
+            total_migrated += self._migrateBatch(batch, current_date)
+        return total_migrated
+
+    def _migrateBatch(self, keys: list[bytes], current_date: datetime) -> int:
+        total_migrated = 0
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for key, value in zip(keys, self.redis_client.mget(keys)):
+            try:
+                job_link = key.decode("utf-8")
+                posted_at = datetime.strptime(value.decode("utf-8"), self.LEGACY_DATE_FORMAT)
+            except (AttributeError, UnicodeDecodeError, ValueError):
+                continue  # Not a job link saved by the previous layout
+
+            if current_date - posted_at <= self.retention:
+                self._queuePosted(pipeline, job_link, posted_at)
+                total_migrated += 1
+            pipeline.delete(key)
+
+        pipeline.execute()
+        return total_migrated
@@ -0,0 +1,159 @@
+"""
+Seed Redis
+
+This script backfills the redis database with job links that have already been published without
+posting them to Discord. It is meant to be run when deploying to a fresh redis instance or after a
+long outage so the bot doesn't flood the channels with old opportunities.
+
+It reuses the `GitHubUtilities` and `JobsUtilities` parsing pipeline over either a full README
+snapshot (default) or a historical commit range (`--since`), bulk-loads the links into redis with
+pipelining, and saves the commit SHAs in `commits/repository_links_commits.json`. It can also migrate
+job links saved as top-level keys by the previous redis layout (`--migrate`).
+
+Usage (from the `src` directory):
+- python SeedRedis.py
+- python SeedRedis.py --source newgrad --since <commit-sha>
+- python SeedRedis.py --dry-run
+- python SeedRedis.py --migrate
+"""
+
+import argparse
+import logging
+import os
+import time
+from typing import Optional
+
+import redis
+from dotenv import load_dotenv
+
+from GitHubUtilities import GitHubUtilities
+from JobsUtilities import JobsUtilities
+from RedisUtilities import RedisUtilities
+
+load_dotenv()
+GITHUB_TOKEN = os.getenv("GIT_TOKEN")
+
+logger = logging.getLogger("seed_redis_logger")
+
+
+def seedSource(
+    github_utilities: GitHubUtilities,
+    job_utilities: JobsUtilities,
+    redis_utilities: RedisUtilities,
+    readme_terms: dict[str, str],
+    isNewGrad: bool,
+    since: Optional[str] = None,
+    batch_size: int = 1000,
+    dry_run: bool = False,
+) -> tuple[int, int]:
+    """
+    Seed the job links of a single repository into redis and save its latest commit
+
+    Parameters:
+        - github_utilities: The GitHubUtilities object for the repository
+        - job_utilities: The JobsUtilities object
+        - redis_utilities: The store of job links that have been posted
+        - readme_terms: The .md files to read mapped to the term of their job postings
+        - isNewGrad: True if the repository is for new grad
+        - since: The base commit sha of a historical range, a full snapshot is used if not given
+        - batch_size: The number of commands sent per pipeline round trip
+        - dry_run: True to parse the job postings without writing to redis or the commits file
+    Returns:
+        - tuple[int, int]: The number of job links found and the number newly added to redis
+    """
+    repo = github_utilities.createGitHubConnection()
+    head_sha = github_utilities.getLastCommit(repo)
+    if since:
+        github_utilities.setComparison(repo, isNewGrad, previous_commit=since, recent_commit=head_sha)
+
+    total_links = 0
+    total_added = 0
+    for readme_file, term in readme_terms.items():
+        if since:
+            job_postings = github_utilities.getCommitChanges(readme_file)
+        else:
+            job_postings = github_utilities.getFileSnapshot(repo, readme_file, head_sha)
+
+        job_links = list(job_utilities.getJobLinks(job_postings, term))
+        total_links += len(job_links)
+        if not dry_run:
+            total_added += job_utilities.seedJobLinks(redis_utilities, job_links, batch_size)
+        logger.info(f"{github_utilities.repo_name} {readme_file}: {len(job_links)} job links found")
+
+    github_utilities.clearComparison()
+    if not dry_run:
+        github_utilities.setNewCommit(head_sha, isNewGrad)
+        logger.info(f"Saved {head_sha} as the last commit for {github_utilities.repo_name}")
+
+    return total_links, total_added
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill redis with job links without posting to Discord.")
+    parser.add_argument("--source", choices=["internship", "newgrad", "all"], default="all")
+    parser.add_argument("--since", help="Base commit sha of the range to ingest instead of a full README snapshot")
+    parser.add_argument("--redis-host", default="redis")
+    parser.add_argument("--redis-port", type=int, default=6379)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true", help="Parse the job postings without writing anything")
+    parser.add_argument("--migrate", action="store_true", help="Migrate the legacy top-level job link keys and exit")
+    args = parser.parse_args()
+
+    if args.migrate:
+        redis_client = redis.Redis(host=args.redis_host, port=args.redis_port, db=0)
+        try:
+            start_time = time.perf_counter()
+            total_migrated = RedisUtilities(redis_client).migrateLegacyKeys(args.batch_size)
+            logger.info(f"Migrated {total_migrated} legacy job links in {time.perf_counter() - start_time:.2f}s")
+        finally:
+            redis_client.close()
+        return
+
+    if args.since and args.source == "all":
+        parser.error("--since requires a single --source since commit shas are specific to a repository")
+
+    sources = []
+    if args.source in ["internship", "all"]:
+        latest_repo = JobsUtilities.get_latest_internship_repo()
+        internship_github = GitHubUtilities(
+            token=GITHUB_TOKEN, repo_name=f"SimplifyJobs/{latest_repo}", isSummer=True, isCoop=True
+        )
+        sources.append((internship_github, {"README.md": "Summer", "README-Off-Season.md": "Co-Op"}, False))
+    if args.source in ["newgrad", "all"]:
+        newgrad_github = GitHubUtilities(token=GITHUB_TOKEN, repo_name="SimplifyJobs/New-Grad-Positions")
+        sources.append((newgrad_github, {"README.md": "New Grad"}, True))
+
+    job_utilities = JobsUtilities()
+    redis_client = redis.Redis(host=args.redis_host, port=args.redis_port, db=0)
+    redis_utilities = RedisUtilities(redis_client)
+    try:
+        start_time = time.perf_counter()
+        total_links = 0
+        total_added = 0
+        for github_utilities, readme_terms, isNewGrad in sources:
+            links, added = seedSource(
+                github_utilities,
+                job_utilities,
+                redis_utilities,
+                readme_terms,
+                isNewGrad,
+                since=args.since,
+                batch_size=args.batch_size,
+                dry_run=args.dry_run,
+            )
+            total_links += links
+            total_added += added
+
+        elapsed = time.perf_counter() - start_time
+        rate = total_links / elapsed if elapsed > 0 else float("inf")
+        logger.info(
+            f"Seeded {total_added} new of {total_links} job links in {elapsed:.2f}s ({rate:,.0f} rows/sec)"
+            + (" [dry run]" if args.dry_run else "")
+        )
+    finally:
+        redis_client.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    main()
@@ -0,0 +1,218 @@
+"""
+Task Supervisor Class
+
+This class supervises the scheduled tasks of the bot with a circuit breaker for each dependency it
+relies on (GitHub, redis, the database, and Discord). When a dependency keeps failing, its breaker
+opens and calls to it are skipped with an exponential backoff instead of shutting down the bot.
+Once the backoff has passed, a single call is let through to probe if the dependency has recovered.
+
+Prerequisites:
+- None, the breakers only track the calls that are made through the supervisor.
+"""
+
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Optional
+
+logger = logging.getLogger("discord_bot_logger")
+
+
+class DependencyError(Exception):
+    """
+    Raised when a call to a dependency fails or its circuit breaker is open.
+    """
+
+    def __init__(self, dependency: str, message: str):
+        super().__init__(f"{dependency}: {message}")
+        self.dependency = dependency
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        base_delay: float = 30,
+        max_delay: float = 900,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.retry_at = 0.0
+
+    def getDelay(self) -> float:
+        """
+        Retrieve the backoff before probing the dependency again, which doubles every time the breaker trips.
+
+        Returns:
+            - float: The delay in seconds
+        """
+        return min(self.base_delay * 2 ** max(self.trips - 1, 0), self.max_delay)
+
+    def allowRequest(self) -> bool:
+        """
+        Determine if a call to the dependency should be made.
+
+        Returns:
+            - bool: True if the breaker is closed or a probe is due, False otherwise
+        """
+        if self.state == self.CLOSED:
+            return True
+
+        if self.state == self.OPEN and self.clock() >= self.retry_at:
+            logger.info(f"Probing {self.name} after {self.getDelay():.0f}s of backoff")
+            self.state = self.HALF_OPEN
+            return True
+
+        # Only a single probe is allowed while half-open
+        return False
+
+    def recordSuccess(self) -> None:
+        """
+        Close the breaker after a successful call.
+        """
+        if self.state != self.CLOSED:
+            logger.info(f"{self.name} has recovered, closing the circuit breaker")
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0
+
+    def recordFailure(self) -> None:
+        """
+        Count a failed call and open the breaker once the threshold is reached or a probe fails.
+        """
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.trips += 1
+            self.state = self.OPEN
+            self.retry_at = self.clock() + self.getDelay()
+            logger.warning(f"{self.name} is unavailable, retrying in {self.getDelay():.0f}s")
+
+    def releaseProbe(self) -> None:
+        """
+        Reopen the breaker when a probe ended without recording a success or a failure, such as when it
+        was cancelled, so the next call probes again instead of being skipped forever.
+        """
+        if self.state == self.HALF_OPEN:
+            self.state = self.OPEN
+
+    def getStatus(self) -> str:
+        """
+        Retrieve a summary of the breaker state.
+
+        Returns:
+            - str: The breaker state
+        """
+        if self.state == self.OPEN:
+            return f"{self.name}: {self.state} (probe in {max(self.retry_at - self.clock(), 0):.0f}s)"
+        return f"{self.name}: {self.state} ({self.failures} failures)"
+
+
+class TaskSupervisor:
+    def __init__(
+        self,
+        dependencies: Iterable[str],
+        errors: Optional[dict[type, str]] = None,
+        **breaker_options: Any,
+    ):
+        self.breakers = {dependency: CircuitBreaker(dependency, **breaker_options) for dependency in dependencies}
+        self.errors = errors or {}
+
+    def getDependency(self, error: Exception, dependency: str) -> str:
+        """
+        Retrieve the dependency to blame for an error, since a call can reach more than one dependency.
+
+        Parameters:
+            - error: The error raised by the call
+            - dependency: The dependency the call was made for
+        Returns:
+            - str: The dependency that failed
+        """
+        for error_type, error_dependency in self.errors.items():
+            if isinstance(error, error_type):
+                return error_dependency
+        return dependency
+
+    def isAvailable(self, dependency: str) -> bool:
+        """
+        Determine if a call to the dependency would be made.
+
+        Parameters:
+            - dependency: The name of the dependency
+        Returns:
+            - bool: True if the breaker is closed, False otherwise
+        """
+        return self.breakers[dependency].state == CircuitBreaker.CLOSED
+
+    def call(self, dependency: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call a function through the circuit breaker of a dependency.
+
+        Parameters:
+            - dependency: The name of the dependency
+            - func: The function to call
+        Returns:
+            - Any: The result of the function
+        """
+        self._allow(dependency)
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            raise self._fail(e, dependency) from e
+        else:
+            self.breakers[dependency].recordSuccess()
+            return result
+        finally:
+            # Cancellation and errors blamed on another dependency leave the probe without a verdict
+            self.breakers[dependency].releaseProbe()
+
+    async def callAsync(self, dependency: str, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """
+        Await a coroutine function through the circuit breaker of a dependency.
+
+        Parameters:
+            - dependency: The name of the dependency
+            - func: The coroutine function to await
+        Returns:
+            - Any: The result of the coroutine
+        """
+        self._allow(dependency)
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            raise self._fail(e, dependency) from e
+        else:
+            self.breakers[dependency].recordSuccess()
+            return result
+        finally:
+            # Cancellation and errors blamed on another dependency leave the probe without a verdict
+            self.breakers[dependency].releaseProbe()
+
+    def getReport(self) -> str:
+        """
+        Retrieve the state of every circuit breaker.
+
+        Returns:
+            - str: The breaker states separated by commas
+        """
+        return ", ".join(breaker.getStatus() for breaker in self.breakers.values())
+
+    def _allow(self, dependency: str) -> None:
+        if not self.breakers[dependency].allowRequest():
+            raise DependencyError(dependency, "circuit breaker is open")
+
+    def _fail(self, error: Exception, dependency: str) -> DependencyError:
+        failed_dependency = self.getDependency(error, dependency)
+        self.breakers[failed_dependency].recordFailure()
+        return DependencyError(failed_dependency, str(error))
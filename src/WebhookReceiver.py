@@ -0,0 +1,159 @@
+"""
+Webhook Receiver Class
+
+This class runs an HTTP server within the bot's event loop to receive GitHub `push` webhooks, so new
+commits are processed right away instead of waiting for the next polling run. Every request is
+verified with the HMAC signature GitHub sends, and bursts of pushes to the same repository are
+coalesced into a single run.
+
+Prerequisites:
+- aiohttp: The async HTTP library that is installed with discord.py.
+- A GitHub webhook on the repositories with the `push` event and a secret.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Optional
+
+from aiohttp import web
+
+logger = logging.getLogger("discord_bot_logger")
+
+
+class WebhookReceiver:
+    PATH = "/webhooks/github"
+
+    def __init__(
+        self,
+        secret: str,
+        on_push: Callable[[str], Awaitable[None]],
+        branch: str = "dev",
+        debounce: float = 2.0,
+    ):
+        if not secret:
+            raise ValueError("A webhook secret is required to verify the GitHub signatures")
+
+        self.secret = secret.encode("utf-8")
+        self.on_push = on_push
+        self.branch = branch
+        self.debounce = debounce
+        self.pending_runs = {}
+        self.running_runs = set()
+        self.runner = None
+
+    def verifySignature(self, body: bytes, signature: Optional[str]) -> bool:
+        """
+        Determine if the request was signed by GitHub with the webhook secret.
+
+        Parameters:
+            - body: The raw request body
+            - signature: The `X-Hub-Signature-256` header
+        Returns:
+            - bool: True if the signature is valid, False otherwise
+        """
+        if not signature or not signature.startswith("sha256="):
+            return False
+
+        expected = hmac.new(self.secret, body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, signature[len("sha256=") :])
+
+    def schedule(self, repo_name: str) -> None:
+        """
+        Queue a run for the repository unless one is already waiting, which will include this push.
+
+        Parameters:
+            - repo_name: The full name of the repository, e.g. SimplifyJobs/New-Grad-Positions
+        """
+        if repo_name in self.pending_runs:
+            logger.info(f"Coalescing push to {repo_name} into the queued run")
+            return
+
+        self.pending_runs[repo_name] = asyncio.create_task(self._run(repo_name))
+
+    async def handlePush(self, request: web.Request) -> web.Response:
+        """
+        Handle a GitHub webhook request.
+
+        Parameters:
+            - request: The webhook request
+        Returns:
+            - web.Response: 202 if a run was queued or the event was ignored, 401 if the signature is invalid
+        """
+        body = await request.read()
+        if not self.verifySignature(body, request.headers.get("X-Hub-Signature-256")):
+            logger.warning("Rejected a webhook with an invalid signature")
+            return web.Response(status=401, text="Invalid signature")
+
+        event = request.headers.get("X-GitHub-Event")
+        if event == "ping":
+            return web.Response(text="pong")
+        if event != "push":
+            return web.Response(status=202, text=f"Ignored {event} event")
+
+        try:
+            payload = json.loads(body)
+            ref = payload["ref"]
+            repo_name = payload["repository"]["full_name"]
+        except (KeyError, TypeError, ValueError):
+            return web.Response(status=400, text="Invalid push payload")
+
+        if ref != f"refs/heads/{self.branch}":
+            return web.Response(status=202, text=f"Ignored push to {ref}")
+
+        logger.info(f"Received push to {repo_name} ({payload.get('after', '')})")
+        self.schedule(repo_name)
+        return web.Response(status=202, text="Queued")
+
+    def getApplication(self) -> web.Application:
+        """
+        Create the web application that receives the webhooks.
+
+        Returns:
+            - web.Application: The web application
+        """
+        app = web.Application()
+        app.router.add_post(self.PATH, self.handlePush)
+        return app
+
+    async def start(self, host: str = "0.0.0.0", port: int = 8080) -> None:
+        """
+        Start receiving webhooks within the running event loop.
+
+        Parameters:
+            - host: The interface to listen on
+            - port: The port to listen on
+        """
+        self.runner = web.AppRunner(self.getApplication())
+        await self.runner.setup()
+        await web.TCPSite(self.runner, host, port).start()
+        logger.info(f"Receiving GitHub webhooks on {host}:{port}{self.PATH}")
+
+    async def stop(self) -> None:
+        """
+        Stop receiving webhooks and cancel the queued and running runs.
+        """
+        for task in [*self.pending_runs.values(), *self.running_runs]:
+            task.cancel()
+        self.pending_runs = {}
+        self.running_runs = set()
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+
+    async def _run(self, repo_name: str) -> None:
+        # Wait for the rest of the burst, then let new pushes queue another run
+        await asyncio.sleep(self.debounce)
+        del self.pending_runs[repo_name]
+
+        # Keep a reference to the running task so it isn't garbage collected and can be cancelled
+        task = asyncio.current_task()
+        self.running_runs.add(task)
+        task.add_done_callback(self.running_runs.discard)
+        try:
+            await self.on_push(repo_name)
+        except Exception:
+            logger.error(f"An error occurred processing the push to {repo_name}.", exc_info=True)
@@ -49,3 +49,27 @@ def setup_job_utilities():
     repo_name = "SimplifyJobs/Summer2025-Internships"
     utilities = GitHubUtilities(token, repo_name)
     return utilities
+
+
+@patch("github.Repository.Repository")
+def test_get_file_snapshot(mock_repo):
+    utilities = GitHubUtilities("token", "repo")
+    readme = "# Jobs\n| Company | Role |\n| Open | Job |\n| Closed | 🔒 |\n"
+    mock_repo.get_contents.return_value.decoded_content = readme.encode("utf-8")
+    result = list(utilities.getFileSnapshot(mock_repo, "README.md", "123abc"))
+    mock_repo.get_contents.assert_called_with("README.md", ref="123abc")
+    assert result == ["+| Company | Role |", "+| Open | Job |"]
+
+
+@patch("github.Repository.Repository")
+def test_set_comparison_uses_given_head(mock_repo):
+    # Arrange
+    utilities = GitHubUtilities("token", "repo")
+    mock_repo.get_branch.return_value.commit.sha = "789ghi"  # The branch moved after the head was read
+
+    # Act
+    utilities.setComparison(mock_repo, False, previous_commit="456def", recent_commit="123abc")
+
+    # Assert
+    mock_repo.compare.assert_called_once_with(base="456def", head="123abc")
+    mock_repo.get_branch.assert_not_called()
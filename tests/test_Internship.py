@@ -61,7 +61,7 @@ async def test_valid_job_posting():
             """
     job_postings = [job]    
     redis_mock = MagicMock()
-    redis_mock.exists.return_value = False
+    redis_mock.isPosted.return_value = False
 
     instance = JobsUtilities()
     instance.saveCompanyName = MagicMock()
@@ -77,3 +77,35 @@ async def test_valid_job_posting():
     assert len(instance.job_cache) == 1  # Ensure the job link was added to the cache
     assert instance.total_jobs == 1  # Ensure the job count was incremented
     mock_bot.get_channel.assert_called()  # Ensure get_channel was called for each channel
+
+
+def test_get_job_links():
+    # Arrange
+    instance = JobsUtilities()
+    job = (
+        '+| **[Rivian](https://simplify.jobs/c/Rivian)** | Software Intern | Urbana, IL | '
+        '<a href="https://careers.rivian.com/jobs/16695"><img src="https://i.imgur.com/w6lyvuC.png"></a> | Feb 05 |'
+    )
+    job_postings = ["+| Company | Role | Location | Application/Link | Date Posted |", job, job]
+
+    # Act
+    job_links = list(instance.getJobLinks(job_postings, "Summer"))
+
+    # Assert
+    assert job_links == ["https://careers.rivian.com/jobs/16695"]
+
+
+def test_seed_job_links():
+    # Arrange
+    instance = JobsUtilities()
+    redis_utilities = MagicMock()
+    redis_utilities.addJobLinks.return_value = 2
+    job_links = ["https://a.com", "https://b.com", "https://c.com"]
+
+    # Act
+    total_added = instance.seedJobLinks(redis_utilities, job_links, batch_size=2)
+
+    # Assert
+    assert total_added == 2
+    redis_utilities.addJobLinks.assert_called_once_with(job_links, 2)
+
@@ -0,0 +1,86 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import discord.ext.commands  # noqa: F401 - JobsUtilities annotates with discord.ext.commands.Bot
+import pytest
+from discord import DiscordServerError, Forbidden
+
+from src.JobsUtilities import JobsUtilities
+
+# Unlike test_Internship.py, these tests use the real discord exceptions
+# To test the code run cmd: make test
+
+JOB = (
+    '+| **[Rivian](https://simplify.jobs/c/Rivian)** | Software Intern | Urbana, IL | '
+    '<a href="https://careers.rivian.com/jobs/16695"><img src="https://i.imgur.com/w6lyvuC.png"></a> | Feb 05 |'
+)
+
+
+def create_bot(*send_results):
+    channels = {}
+    for channel_id, result in enumerate(send_results):
+        channel = AsyncMock()
+        channel.send.side_effect = result if isinstance(result, BaseException) else None
+        channels[channel_id] = channel
+
+    bot = MagicMock()
+    bot.get_channel.side_effect = channels.get
+    return bot, list(channels)
+
+
+def create_instance():
+    instance = JobsUtilities()
+    instance.isWithinDateRange = MagicMock(return_value=True)
+    redis_mock = MagicMock()
+    redis_mock.isPosted.return_value = False
+    return instance, redis_mock
+
+
+def server_error():
+    return DiscordServerError(MagicMock(status=503, reason="Service Unavailable"), "")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [server_error(), ConnectionResetError("Connection reset by peer"), asyncio.TimeoutError()],
+)
+async def test_send_failure_is_not_marked_posted(error):
+    # Arrange
+    bot, channels = create_bot(error)
+    instance, redis_mock = create_instance()
+
+    # Act
+    with pytest.raises(type(error)):
+        await instance.getJobs(bot, redis_mock, channels, [JOB], "Summer")
+
+    # Assert
+    redis_mock.markPosted.assert_not_called()  # The job is retried instead of being lost
+    assert instance.total_jobs == 0
+
+
+@pytest.mark.asyncio
+async def test_partial_send_failure_is_marked_posted():
+    # Arrange
+    bot, channels = create_bot(None, server_error())
+    instance, redis_mock = create_instance()
+
+    # Act
+    await instance.getJobs(bot, redis_mock, channels, [JOB], "Summer")
+
+    # Assert
+    redis_mock.markPosted.assert_called_once_with(["https://careers.rivian.com/jobs/16695"])  # Not posted twice
+    assert instance.total_jobs == 1
+
+
+@pytest.mark.asyncio
+async def test_channel_failure_is_marked_posted():
+    # Arrange
+    bot, channels = create_bot(Forbidden(MagicMock(status=403, reason="Forbidden"), "Missing Permissions"))
+    instance, redis_mock = create_instance()
+
+    # Act
+    await instance.getJobs(bot, redis_mock, channels, [JOB], "Summer")
+
+    # Assert
+    redis_mock.markPosted.assert_called_once()  # A single server can't block the job
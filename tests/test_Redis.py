@@ -0,0 +1,107 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from src.RedisUtilities import RedisUtilities
+
+# To test the code run cmd: make test
+
+
+def test_get_link_id():
+    # Arrange
+    redis_utilities = RedisUtilities(MagicMock(), links_per_month=1000)
+
+    # Act
+    shard, link_id = redis_utilities.getLinkId("https://careers.rivian.com/jobs/16695")
+
+    # Assert
+    assert 0 <= shard < 16
+    assert len(link_id) == 8
+    assert redis_utilities.getLinkId("https://careers.rivian.com/jobs/16695") == (shard, link_id)
+
+
+def test_get_shard_count():
+    # Arrange
+    redis_utilities = RedisUtilities(MagicMock())
+
+    # Act / Assert
+    assert redis_utilities.getShardCount(1) == 1
+    assert redis_utilities.getShardCount(20000) == 512
+    assert redis_utilities.getShardCount(142858) == 4096
+
+
+def test_get_live_months():
+    # Arrange
+    redis_utilities = RedisUtilities(MagicMock(), retention_days=60)
+
+    # Act
+    months = redis_utilities.getLiveMonths(datetime(2025, 3, 15))
+
+    # Assert
+    assert [f"{month:%Y%m}" for month in months] == ["202503", "202502", "202501"]
+
+
+def test_get_bucket_expiry():
+    # Arrange
+    redis_utilities = RedisUtilities(MagicMock(), retention_days=30)
+
+    # Act
+    expiry = redis_utilities.getBucketExpiry(datetime(2024, 12, 20, 13, 45))
+
+    # Assert
+    assert expiry == datetime(2025, 1, 31)
+
+
+def test_get_posted_links():
+    # Arrange
+    redis_mock = MagicMock()
+    pipeline = redis_mock.pipeline.return_value
+    redis_utilities = RedisUtilities(redis_mock, retention_days=30)
+    current_date = datetime(2025, 3, 15)
+    pipeline.execute.return_value = [False, False, False, True]  # Two live months per link
+
+    # Act
+    posted_links = redis_utilities.getPostedLinks(["https://a.com", "https://b.com"], current_date)
+
+    # Assert
+    assert posted_links == {"https://b.com"}
+    assert pipeline.hexists.call_count == 4
+
+
+def test_add_job_links():
+    # Arrange
+    redis_mock = MagicMock()
+    pipeline = redis_mock.pipeline.return_value
+    redis_utilities = RedisUtilities(redis_mock, retention_days=30)
+    posted_at = datetime(2025, 3, 15)
+    pipeline.execute.side_effect = [
+        [False, False, True, False],  # Lookup of the first batch
+        [],  # Save of the first batch
+        [False, False],  # Lookup of the second batch
+        [],  # Save of the second batch
+    ]
+
+    # Act
+    total_added = redis_utilities.addJobLinks(["https://a.com", "https://b.com", "https://c.com"], 2, posted_at)
+
+    # Assert
+    assert total_added == 2
+    assert pipeline.hset.call_count == 2
+    saved_key = pipeline.hset.call_args_list[0].args[0]
+    assert saved_key.startswith("jobs:202503:")
+
+
+def test_migrate_legacy_keys():
+    # Arrange
+    redis_mock = MagicMock()
+    pipeline = redis_mock.pipeline.return_value
+    redis_utilities = RedisUtilities(redis_mock, retention_days=30)
+    redis_mock.scan_iter.return_value = [b"https://new.com", b"https://old.com", b"other"]
+    redis_mock.mget.return_value = [b"2025-03-10 08:00:00", b"2024-01-01 08:00:00", b"not a date"]
+
+    # Act
+    total_migrated = redis_utilities.migrateLegacyKeys(current_date=datetime(2025, 3, 15))
+
+    # Assert
+    assert total_migrated == 1
+    assert pipeline.hset.call_count == 1
+    assert [call.args[0] for call in pipeline.delete.call_args_list] == [b"https://new.com", b"https://old.com"]
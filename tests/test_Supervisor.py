@@ -0,0 +1,122 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import redis
+
+from src.TaskSupervisor import CircuitBreaker, DependencyError, TaskSupervisor
+
+# To test the code run cmd: make test
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_breaker_opens_after_threshold():
+    # Arrange
+    breaker = CircuitBreaker("github", failure_threshold=2, base_delay=10, clock=FakeClock())
+
+    # Act
+    breaker.recordFailure()
+    is_closed = breaker.state == CircuitBreaker.CLOSED
+    breaker.recordFailure()
+
+    # Assert
+    assert is_closed
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allowRequest()
+
+
+def test_breaker_half_open_probe():
+    # Arrange
+    clock = FakeClock()
+    breaker = CircuitBreaker("redis", failure_threshold=1, base_delay=10, clock=clock)
+    breaker.recordFailure()
+
+    # Act
+    clock.now = 10
+    is_probe_allowed = breaker.allowRequest()
+    is_second_call_allowed = breaker.allowRequest()
+    breaker.recordSuccess()
+
+    # Assert
+    assert is_probe_allowed
+    assert not is_second_call_allowed
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allowRequest()
+
+
+def test_breaker_exponential_backoff():
+    # Arrange
+    clock = FakeClock()
+    breaker = CircuitBreaker("database", failure_threshold=1, base_delay=10, max_delay=25, clock=clock)
+
+    # Act
+    delays = []
+    for _ in range(3):
+        breaker.recordFailure()
+        delays.append(breaker.retry_at - clock.now)
+        clock.now = breaker.retry_at
+        breaker.allowRequest()  # The probe fails on the next loop
+
+    # Assert
+    assert delays == [10, 20, 25]
+
+
+def test_supervisor_blames_dependency_by_error():
+    # Arrange
+    supervisor = TaskSupervisor(["github", "redis"], errors={redis.exceptions.RedisError: "redis"}, failure_threshold=1)
+    failing_call = MagicMock(side_effect=redis.exceptions.ConnectionError("Connection refused"))
+
+    # Act
+    with pytest.raises(DependencyError) as error:
+        supervisor.call("github", failing_call)
+
+    # Assert
+    assert error.value.dependency == "redis"
+    assert not supervisor.isAvailable("redis")
+    assert supervisor.isAvailable("github")
+    assert supervisor.call("github", lambda: "sha") == "sha"
+
+
+@pytest.mark.asyncio
+async def test_supervisor_skips_open_breaker():
+    # Arrange
+    supervisor = TaskSupervisor(["discord"], failure_threshold=1, base_delay=60)
+    post = AsyncMock(side_effect=ConnectionError("Gateway closed"))
+
+    # Act
+    with pytest.raises(DependencyError):
+        await supervisor.callAsync("discord", post)
+    with pytest.raises(DependencyError):
+        await supervisor.callAsync("discord", post)
+
+    # Assert
+    assert post.await_count == 1  # The second call is skipped while the breaker is open
+    assert "discord: open" in supervisor.getReport()
+
+
+@pytest.mark.asyncio
+async def test_supervisor_cancelled_probe_reopens_breaker():
+    # Arrange
+    clock = FakeClock()
+    supervisor = TaskSupervisor(["github"], failure_threshold=1, base_delay=10, clock=clock)
+    supervisor.breakers["github"].recordFailure()
+    clock.now = 10
+    cancelled_call = AsyncMock(side_effect=asyncio.CancelledError())
+
+    # Act
+    with pytest.raises(asyncio.CancelledError):
+        await supervisor.callAsync("github", cancelled_call)
+    is_open = supervisor.breakers["github"].state == CircuitBreaker.OPEN
+    result = await supervisor.callAsync("github", AsyncMock(return_value="sha"))
+
+    # Assert
+    assert is_open
+    assert result == "sha"  # The next call probes again instead of being skipped
+    assert supervisor.isAvailable("github")
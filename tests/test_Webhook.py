@@ -0,0 +1,116 @@
+import asyncio
+import hashlib
+import hmac
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from src.WebhookReceiver import WebhookReceiver
+
+# To test the code run cmd: make test
+
+SECRET = "test-secret"
+PUSH_PAYLOAD = (Path(__file__).parent / "payloads" / "push.json").read_bytes()
+
+
+def sign(body: bytes, secret: str = SECRET) -> str:
+    return "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+async def send(client: TestClient, body: bytes, event: str = "push", signature: str = None):
+    headers = {"X-GitHub-Event": event, "X-Hub-Signature-256": signature or sign(body)}
+    return await client.post(WebhookReceiver.PATH, data=body, headers=headers)
+
+
+def test_verify_signature():
+    # Arrange
+    receiver = WebhookReceiver(SECRET, AsyncMock())
+
+    # Act / Assert
+    assert receiver.verifySignature(PUSH_PAYLOAD, sign(PUSH_PAYLOAD))
+    assert not receiver.verifySignature(PUSH_PAYLOAD, sign(PUSH_PAYLOAD, "wrong-secret"))
+    assert not receiver.verifySignature(PUSH_PAYLOAD, None)
+
+
+def test_secret_is_required():
+    with pytest.raises(ValueError):
+        WebhookReceiver("", AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_push_triggers_run():
+    # Arrange
+    on_push = AsyncMock()
+    receiver = WebhookReceiver(SECRET, on_push, debounce=0.01)
+
+    async with TestClient(TestServer(receiver.getApplication())) as client:
+        # Act
+        response = await send(client, PUSH_PAYLOAD)
+        await asyncio.sleep(0.05)
+
+    # Assert
+    assert response.status == 202
+    on_push.assert_awaited_once_with("SimplifyJobs/New-Grad-Positions")
+
+
+@pytest.mark.asyncio
+async def test_burst_of_pushes_is_coalesced():
+    # Arrange
+    on_push = AsyncMock()
+    receiver = WebhookReceiver(SECRET, on_push, debounce=0.05)
+
+    async with TestClient(TestServer(receiver.getApplication())) as client:
+        # Act
+        for _ in range(5):
+            await send(client, PUSH_PAYLOAD)
+        await asyncio.sleep(0.1)
+
+    # Assert
+    on_push.assert_awaited_once_with("SimplifyJobs/New-Grad-Positions")
+
+
+@pytest.mark.asyncio
+async def test_invalid_and_ignored_requests():
+    # Arrange
+    on_push = AsyncMock()
+    receiver = WebhookReceiver(SECRET, on_push, debounce=0.01)
+    other_branch = PUSH_PAYLOAD.replace(b"refs/heads/dev", b"refs/heads/main")
+
+    async with TestClient(TestServer(receiver.getApplication())) as client:
+        # Act
+        unsigned = await send(client, PUSH_PAYLOAD, signature="sha256=invalid")
+        ping = await send(client, b'{"zen": "Keep it logically awesome."}', event="ping")
+        branch = await send(client, other_branch)
+        await asyncio.sleep(0.05)
+
+    # Assert
+    assert unsigned.status == 401
+    assert ping.status == 200
+    assert branch.status == 202
+    on_push.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_running_run():
+    # Arrange
+    started = asyncio.Event()
+
+    async def on_push(repo_name):
+        started.set()
+        await asyncio.sleep(10)
+
+    receiver = WebhookReceiver(SECRET, on_push, debounce=0)
+    receiver.schedule("SimplifyJobs/New-Grad-Positions")
+    await started.wait()
+    running_runs = set(receiver.running_runs)
+
+    # Act
+    await receiver.stop()
+    await asyncio.sleep(0)
+
+    # Assert
+    assert len(running_runs) == 1
+    assert all(task.cancelled() for task in running_runs)
+    assert not receiver.running_runs